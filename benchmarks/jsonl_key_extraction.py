@@ -0,0 +1,60 @@
+"""Benchmark key extraction when indexing JSONl files with wide documents.
+
+Usage: python benchmarks/jsonl_key_extraction.py [n_lines] [text_size]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import orjson
+
+from indxr import scanner
+from indxr.handlers import jsonl_handler
+
+
+def write_sample(path: str, n_lines: int, text_size: int):
+    text = ("lorem ipsum dolor sit amet " * (text_size // 27 + 1))[:text_size]
+
+    with open(path, "wb") as f:
+        for i in range(n_lines):
+            f.write(orjson.dumps({"id": f"doc_{i}", "title": "t", "text": text}))
+            f.write(b"\n")
+
+
+def bench(lines: list[bytes], extract) -> float:
+    start = time.perf_counter()
+    for line in lines:
+        extract(line)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    n_lines = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    text_size = int(sys.argv[2]) if len(sys.argv) > 2 else 4_096
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "sample.jsonl")
+        write_sample(path, n_lines, text_size)
+        size = os.path.getsize(path) / 2**20
+
+        # Lines are loaded in advance to measure key extraction only
+        lines = [
+            bytes(line)
+            for _, chunk, bounds in scanner.iter_chunks(path)
+            for line in scanner.iter_lines(chunk, bounds)
+        ]
+
+        full = bench(lines, lambda line: orjson.loads(line)["id"])
+        fast = bench(lines, lambda line: jsonl_handler.extract_key(line, "id"))
+
+        start = time.perf_counter()
+        jsonl_handler.index(path)
+        total = time.perf_counter() - start
+
+    print(f"{n_lines:,} lines, {text_size:,} B text field, {size:,.0f} MiB")
+    print(f"full parsing:   {full:.3f} s ({size / full:,.0f} MiB/s)")
+    print(f"key extraction: {fast:.3f} s ({size / fast:,.0f} MiB/s)")
+    print(f"speedup:        {full / fast:.1f}x")
+    print(f"indexing:       {total:.3f} s ({size / total:,.0f} MiB/s)")
@@ -1,20 +1,57 @@
+import os
 from csv import reader
-from io import BufferedReader
+from functools import partial
+from itertools import chain
 
 import numpy as np
 
+from .. import scanner
+from ..offset_index import OffsetIndex
+from ..readers import Reader, read_many
 
-def csv_line_to_dict(line: str, fieldnames: list, delimiter: str) -> dict:
+
+def csv_line_to_dict(line: bytes, fieldnames: list, delimiter: str) -> dict:
     return dict(
         zip(
             fieldnames,
-            list(reader([line.decode("utf-8")], delimiter=delimiter))[0],
+            list(reader([str(line, "utf-8")], delimiter=delimiter))[0],
         )
     )
 
 
-def csv_line_to_list(line: str, delimiter: str) -> list:
-    return list(reader([line.decode("utf-8")], delimiter=delimiter))[0]
+def csv_line_to_list(line: bytes, delimiter: str) -> list:
+    return list(reader([str(line, "utf-8")], delimiter=delimiter))[0]
+
+
+def index_range(
+    path: str,
+    start: int,
+    stop: int,
+    delimiter: str = ",",
+    fieldnames: list = None,
+    return_dict: bool = True,
+    key_id: str = "id",
+) -> tuple[np.ndarray, list]:
+    if not return_dict:
+        return scanner.line_offsets(path, start, stop), []
+
+    if key_id not in fieldnames:
+        raise KeyError(key_id)
+
+    # Last column named `key_id`, as in `csv_line_to_dict`
+    key_position = len(fieldnames) - 1 - fieldnames[::-1].index(key_id)
+    offsets, keys = [], []  # Init offsets and keys lists
+
+    for position, chunk, bounds in scanner.iter_chunks(path, start, stop):
+        keys.extend(
+            next(reader([str(line, "utf-8")], delimiter=delimiter))[key_position]
+            for line in scanner.iter_lines(chunk, bounds)
+        )
+        offsets.append(bounds[:-1].astype(np.uint64) + np.uint64(position))
+
+    offsets = np.concatenate(offsets) if offsets else np.empty(0, dtype=np.uint64)
+
+    return offsets, keys
 
 
 def index(
@@ -24,46 +61,55 @@ def index(
     has_header: bool = True,
     return_dict: bool = True,
     key_id: str = "id",
-) -> dict:
+    num_workers: int = 1,
+) -> tuple[list, OffsetIndex]:
     assert (
         fieldnames or has_header
     ), "File must have header or fieldnames must be defined by user"
 
-    index = {}
+    end = os.path.getsize(path)
 
     with open(path, "rb") as file:
-        position = file.tell()  # Init position
-
-        for i, line in enumerate(file):
-            if i == 0 and has_header:
-                if not fieldnames:
-                    fieldnames = line.decode("utf-8").strip().split(delimiter)
-
-            elif return_dict:
-                idx = csv_line_to_dict(
-                    line=line, fieldnames=fieldnames, delimiter=delimiter
-                )[key_id]
-                index[idx] = position
-
-            else:
-                index[i] = position
-
-            position = file.tell()  # Update position
+        header = file.readline() if has_header else b""
+
+    if not fieldnames:
+        fieldnames = header.decode("utf-8").strip().split(delimiter)
+
+    results = scanner.map_ranges(
+        partial(
+            index_range,
+            path,
+            delimiter=delimiter,
+            fieldnames=fieldnames,
+            return_dict=return_dict,
+            key_id=key_id,
+        ),
+        path,
+        num_workers=num_workers,
+        start=len(header),
+        stop=end,
+    )
 
-    return fieldnames, index
+    return fieldnames, OffsetIndex(
+        np.concatenate([offsets for offsets, _ in results]),
+        keys=(
+            list(chain.from_iterable(keys for _, keys in results))
+            if return_dict
+            else None
+        ),
+        end=end,
+    )
 
 
 def get(
-    file: BufferedReader,
-    index: dict,
-    idx: str,
+    reader: Reader,
+    position: int,
+    size: int,
     delimiter: str = ",",
     fieldnames: list = None,
     return_dict: bool = True,
 ) -> dict:
-    position = index[idx]
-    file.seek(position)
-    line = file.readline()
+    line = reader.read(position, size)
 
     return (
         csv_line_to_dict(line=line, fieldnames=fieldnames, delimiter=delimiter)
@@ -73,21 +119,14 @@ def get(
 
 
 def mget(
-    file: BufferedReader,
-    index: dict,
-    indices: str,
+    reader: Reader,
+    positions: np.ndarray,
+    sizes: np.ndarray,
     delimiter: str = ",",
     fieldnames: list = None,
     return_dict: bool = True,
 ) -> list[dict]:
-    positions = np.array([index[idx] for idx in indices])
-    sorting_indices = np.argsort(positions)
-
-    lines = [None] * len(positions)
-
-    for i in sorting_indices:
-        file.seek(positions[i])
-        lines[i] = file.readline()
+    lines = read_many(reader, positions, sizes)
 
     if return_dict:
         return [
@@ -1,37 +1,47 @@
-from io import BufferedReader
+import os
+from functools import partial
 
 import numpy as np
 
+from .. import scanner
+from ..offset_index import OffsetIndex
+from ..readers import Reader, read_many
 
-def index(path: str) -> dict:
-    index = {}  # Init index dictionary
+WHITESPACE = frozenset(b" \t\n\r\x0b\x0c")
 
-    with open(path, "rb") as file:
-        position = file.tell()  # Init position
 
-        for i, _ in enumerate(file):
-            index[str(i)] = position
-            position = file.tell()  # Update position
+def strip(line: bytes | memoryview) -> bytes | memoryview:
+    """Same as `bytes.strip`, but also for memory views, without copies."""
+    if isinstance(line, bytes):
+        return line.strip()
 
-    return index
+    start, end = 0, len(line)
+    while start < end and line[start] in WHITESPACE:
+        start += 1
+    while end > start and line[end - 1] in WHITESPACE:
+        end -= 1
 
+    return line[start:end]
 
-def get(file: BufferedReader, index: dict, idx: int) -> bytes:
-    position = index[idx]
-    file.seek(position)
-    line = file.readline()
 
-    return line.strip()
+def index(path: str, num_workers: int = 1) -> OffsetIndex:
+    end = os.path.getsize(path)
+    offsets = scanner.map_ranges(
+        partial(scanner.line_offsets, path), path, num_workers=num_workers, stop=end
+    )
 
+    return OffsetIndex(np.concatenate(offsets), end=end)
 
-def mget(file: BufferedReader, index: dict, indices: str) -> list[bytes]:
-    positions = np.array([index[idx] for idx in indices])
-    sorting_indices = np.argsort(positions)
 
-    lines = [None] * len(positions)
+def get(reader: Reader, position: int, size: int) -> bytes | memoryview:
+    line = reader.read(position, size)
 
-    for i in sorting_indices:
-        file.seek(positions[i])
-        lines[i] = file.readline()
+    return strip(line)
 
-    return [line.strip() for line in lines]
+
+def mget(
+    reader: Reader, positions: np.ndarray, sizes: np.ndarray
+) -> list[bytes | memoryview]:
+    lines = read_many(reader, positions, sizes)
+
+    return [strip(line) for line in lines]
@@ -1,39 +1,112 @@
-from io import BufferedReader
+import os
+from functools import lru_cache, partial
+from itertools import chain
 
 import numpy as np
 import orjson
 
+from .. import scanner
+from ..offset_index import OffsetIndex
+from ..readers import Reader, read_many
 
-def index(path: str, key_id: str = "id") -> dict:
-    index = {}  # Init index dictionary
+# Shorter lines are parsed faster by orjson than searched by Python code
+MIN_EXTRACT_SIZE = 2048
 
-    with open(path, "rb") as file:
-        position = file.tell()  # Init position
 
-        for line in file:
-            idx = orjson.loads(line)[key_id]
-            index[idx] = position
-            position = file.tell()  # Update position
+@lru_cache
+def key_prefix(key_id: str) -> bytes:
+    return b"{" + orjson.dumps(key_id) + b":"
 
-    return index
 
+def extract_key(
+    line: bytes, key_id: str = "id", start: int = 0, end: int = None
+) -> str | int:
+    """Extract the value of `key_id` from a JSON line without parsing it.
 
-def get(file: BufferedReader, index: dict, idx: str) -> dict:
-    position = index[idx]
-    file.seek(position)
-    line = file.readline()
+    The raw bytes are searched for `key_id` as first field of the object with
+    a plain string or integer value, which cannot be confused with a nested
+    field. Otherwise (e.g., `key_id` is not the first field or its value has
+    escape sequences), or if the line is short, the line is fully parsed.
+
+    Args:
+        line (bytes): Buffer containing the line.
+        key_id (str, optional): Field to extract. Defaults to "id".
+        start (int, optional): Where the line starts in `line`. Defaults to 0.
+        end (int, optional): Where the line ends in `line`. Defaults to None.
+
+    Returns:
+        str | int: Value of `key_id`.
+    """
+    end = len(line) if end is None else end
+    prefix = key_prefix(key_id)
+
+    if end - start >= MIN_EXTRACT_SIZE and line.startswith(prefix, start, end):
+        i = start + len(prefix)
+        i += line.startswith(b" ", i, end)  # Default separator of Python json
+
+        if line.startswith(b'"', i, end):
+            j = line.find(b'"', i + 1, end)
+
+            if (
+                j != -1
+                and line.find(b"\\", i + 1, j) == -1
+                and line.startswith((b",", b"}"), j + 1, end)
+            ):
+                return line[i + 1 : j].decode("utf-8")
+
+        else:
+            j = line.find(b",", i, end)
+            j = line.find(b"}", i, end) if j == -1 else j
+
+            if j != -1:
+                try:
+                    return int(line[i:j])
+                except ValueError:
+                    pass
+
+    return orjson.loads(memoryview(line)[start:end])[key_id]
 
-    return orjson.loads(line)  # Convert line to Python dictionary
 
+def index_range(
+    path: str, start: int, stop: int, key_id: str = "id"
+) -> tuple[np.ndarray, list]:
+    offsets, keys = [], []  # Init offsets and keys lists
 
-def mget(file: BufferedReader, index: dict, indices: str) -> list[dict]:
-    positions = np.array([index[idx] for idx in indices])
-    sorting_indices = np.argsort(positions)
+    for position, chunk, bounds in scanner.iter_chunks(path, start, stop):
+        keys.extend(
+            extract_key(chunk, key_id, a, b)
+            for a, b in zip(bounds[:-1].tolist(), bounds[1:].tolist())
+        )
+        offsets.append(bounds[:-1].astype(np.uint64) + np.uint64(position))
+
+    offsets = np.concatenate(offsets) if offsets else np.empty(0, dtype=np.uint64)
+
+    return offsets, keys
+
+
+def index(path: str, key_id: str = "id", num_workers: int = 1) -> OffsetIndex:
+    end = os.path.getsize(path)
+    results = scanner.map_ranges(
+        partial(index_range, path, key_id=key_id),
+        path,
+        num_workers=num_workers,
+        stop=end,
+    )
+
+    return OffsetIndex(
+        np.concatenate([offsets for offsets, _ in results]),
+        keys=list(chain.from_iterable(keys for _, keys in results)),
+        end=end,
+    )
+
+
+def get(reader: Reader, position: int, size: int) -> dict:
+    line = reader.read(position, size)
+
+    return orjson.loads(line)  # Convert line to Python dictionary
 
-    lines = [None] * len(positions)
 
-    for i in sorting_indices:
-        file.seek(positions[i])
-        lines[i] = file.readline()
+def mget(reader: Reader, positions: np.ndarray, sizes: np.ndarray) -> list[dict]:
+    lines = read_many(reader, positions, sizes)
 
     return [orjson.loads(line) for line in lines]
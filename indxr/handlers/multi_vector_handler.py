@@ -2,28 +2,34 @@ import re
 
 import numpy as np
 
+from ..offset_index import OffsetIndex
+
 
 def get_itemsize(dtype: str):
     return int(re.sub("\D", "", dtype)) // 8
 
 
-def index(dtype: str, shape: tuple[int], mapping: dict) -> dict:
+def index(dtype: str, shape: tuple[int], mapping: dict) -> OffsetIndex:
     step = shape[1] * get_itemsize(dtype)
-    index = {k: v["offset"] * step for k, v in mapping.items()}
-    index["dim"] = shape[1]
-    index["dtype"] = dtype
-    return index
+    offsets = np.asarray([v["offset"] for v in mapping.values()], dtype=np.uint64)
+    lengths = np.asarray([v["length"] for v in mapping.values()], dtype=np.uint64)
+    return OffsetIndex(offsets * step, keys=list(mapping), sizes=lengths * step)
 
 
-def get(path: str, index: dict, mapping: dict, idx: str) -> np.ndarray:
+def get(path: str, position: int, size: int, dtype: str, dim: int) -> np.ndarray:
     return np.memmap(
         path,
-        dtype=index["dtype"],
+        dtype=dtype,
         mode="r",
-        shape=(mapping[idx]["length"], index["dim"]),
-        offset=index[idx],
+        shape=(size // (dim * get_itemsize(dtype)), dim),
+        offset=position,
     )
 
 
-def mget(path: str, index: dict, mapping: dict, indices: list[str]) -> np.ndarray:
-    return [get(path, index, mapping, idx) for idx in indices]
+def mget(
+    path: str, positions: np.ndarray, sizes: np.ndarray, dtype: str, dim: int
+) -> list[np.ndarray]:
+    return [
+        get(path, int(position), int(size), dtype, dim)
+        for position, size in zip(positions, sizes)
+    ]
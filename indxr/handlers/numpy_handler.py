@@ -2,50 +2,51 @@ import re
 
 import numpy as np
 
+from ..offset_index import OffsetIndex
+
 
 def get_itemsize(dtype: str):
     return int(re.sub("\D", "", dtype)) // 8
 
 
-def index(dtype: str, shape: tuple[int], ids: list[str] = None) -> dict:
+def index(dtype: str, shape: tuple[int], ids: list[str] = None) -> OffsetIndex:
     step = shape[1] * get_itemsize(dtype)
 
     if ids is not None:
         assert len(ids) == shape[0], "Please provide an ID for each row."
-        index = {id: i * step for i, id in enumerate(ids)}
-
-    else:
-        index = {str(i): i * step for i in range(shape[0])}
 
-    index["dim"] = shape[1]
-    index["dtype"] = dtype
-
-    return index
+    return OffsetIndex(
+        np.arange(shape[0], dtype=np.uint64) * step, keys=ids, end=shape[0] * step
+    )
 
 
-def get(path: str, index: dict, idx: str) -> np.ndarray:
+def get(path: str, position: int, dtype: str, dim: int) -> np.ndarray:
     return np.memmap(
         path,
-        dtype=index["dtype"],
+        dtype=dtype,
         mode="r",
-        shape=(1, index["dim"]),
-        offset=index[idx],
+        shape=(1, dim),
+        offset=position,
     )[0]
 
 
-def mget(path: str, index: dict, indices: list[str]) -> np.ndarray:
-    return np.asarray([get(path, index, idx) for idx in indices])
+def mget(path: str, positions: np.ndarray, dtype: str, dim: int) -> np.ndarray:
+    return np.asarray([get(path, int(p), dtype, dim) for p in positions])
 
 
-def get_slice(path: str, index: dict, start: int, stop: int) -> np.ndarray:
+def get_slice(
+    path: str, index: OffsetIndex, start: int, stop: int, dtype: str, dim: int
+) -> np.ndarray:
     return np.memmap(
         path,
-        dtype=index["dtype"],
+        dtype=dtype,
         mode="r",
-        shape=(stop - start, index["dim"]),
-        offset=index[str(start)],
+        shape=(stop - start, dim),
+        offset=int(index.offsets[start]),
     )
 
 
-def mget_slice(path: str, index: dict, slices: list[tuple[int]]) -> np.ndarray:
-    return [get_slice(path, index, *slice) for slice in slices]
+def mget_slice(
+    path: str, index: OffsetIndex, slices: list[tuple[int]], dtype: str, dim: int
+) -> np.ndarray:
+    return [get_slice(path, index, *slice, dtype, dim) for slice in slices]
@@ -1,37 +1,29 @@
-from io import BufferedReader
+import os
+from functools import partial
 
 import numpy as np
 
+from .. import scanner
+from ..offset_index import OffsetIndex
+from ..readers import Reader, read_many
 
-def index(path: str) -> dict:
-    index = {}  # Init index dictionary
 
-    with open(path, "rb") as file:
-        position = file.tell()  # Init position
+def index(path: str, num_workers: int = 1) -> OffsetIndex:
+    end = os.path.getsize(path)
+    offsets = scanner.map_ranges(
+        partial(scanner.line_offsets, path), path, num_workers=num_workers, stop=end
+    )
 
-        for i, _ in enumerate(file):
-            index[str(i)] = position
-            position = file.tell()  # Update position
+    return OffsetIndex(np.concatenate(offsets), end=end)
 
-    return index
 
+def get(reader: Reader, position: int, size: int) -> str:
+    line = reader.read(position, size)
 
-def get(file: BufferedReader, index: dict, idx: str) -> str:
-    position = index[idx]
-    file.seek(position)
-    line = file.readline()
+    return str(line, "utf-8").strip()
 
-    return line.decode("utf-8").strip()
 
+def mget(reader: Reader, positions: np.ndarray, sizes: np.ndarray) -> list[str]:
+    lines = read_many(reader, positions, sizes)
 
-def mget(file: BufferedReader, index: dict, indices: str) -> list[str]:
-    positions = np.array([index[idx] for idx in indices])
-    sorting_indices = np.argsort(positions)
-
-    lines = [None] * len(positions)
-
-    for i in sorting_indices:
-        file.seek(positions[i])
-        lines[i] = file.readline()
-
-    return [line.decode("utf-8").strip() for line in lines]
+    return [str(line, "utf-8").strip() for line in lines]
@@ -0,0 +1,94 @@
+import struct
+
+import numpy as np
+import orjson
+
+# Layout: MAGIC | VERSION (uint32) | HEADER SIZE (uint32) | HEADER (JSON) | ARRAYS
+# Arrays are stored raw and aligned, so that they can be memory-mapped directly.
+MAGIC = b"INDXR\x00\x00\x00"
+VERSION = 1
+ALIGNMENT = 64
+PREAMBLE = struct.Struct("<II")
+
+
+def align(position: int) -> int:
+    return -(-position // ALIGNMENT) * ALIGNMENT
+
+
+def is_index_file(path: str) -> bool:
+    with open(path, "rb") as file:
+        return file.read(len(MAGIC)) == MAGIC
+
+
+def write(path: str, header: dict, arrays: dict[str, np.ndarray]):
+    """Write header and arrays to a binary index file.
+
+    Args:
+        path (str): Where to write the index file.
+        header (dict): JSON-serializable metadata.
+        arrays (dict[str, np.ndarray]): Arrays to store. None values are skipped.
+    """
+    arrays = {k: np.ascontiguousarray(v) for k, v in arrays.items() if v is not None}
+
+    # Array positions are relative to the start of the data section
+    layout, position = {}, 0
+    for name, array in arrays.items():
+        layout[name] = {
+            "dtype": array.dtype.str,
+            "shape": list(array.shape),
+            "offset": position,
+        }
+        position = align(position + array.nbytes)
+
+    meta = orjson.dumps({**header, "arrays": layout})
+    data_start = align(len(MAGIC) + PREAMBLE.size + len(meta))
+
+    with open(path, "wb") as file:
+        file.write(MAGIC)
+        file.write(PREAMBLE.pack(VERSION, len(meta)))
+        file.write(meta)
+
+        for name, array in arrays.items():
+            file.write(b"\x00" * (data_start + layout[name]["offset"] - file.tell()))
+            file.write(array.tobytes())
+
+
+def read(path: str) -> tuple[dict, dict[str, np.ndarray]]:
+    """Read a binary index file, memory-mapping its arrays.
+
+    Args:
+        path (str): Where the index file is located.
+
+    Returns:
+        tuple[dict, dict[str, np.ndarray]]: Header and read-only arrays.
+    """
+    with open(path, "rb") as file:
+        if file.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not an indxr index file.")
+
+        version, meta_size = PREAMBLE.unpack(file.read(PREAMBLE.size))
+        if version > VERSION:
+            raise ValueError(
+                f"Index file version {version} is not supported, please upgrade indxr."
+            )
+
+        header = orjson.loads(file.read(meta_size))
+
+    data_start = align(len(MAGIC) + PREAMBLE.size + meta_size)
+    arrays = {}
+
+    for name, spec in header.pop("arrays").items():
+        shape = tuple(spec["shape"])
+
+        if 0 in shape:
+            arrays[name] = np.empty(shape, dtype=spec["dtype"])
+        else:
+            arrays[name] = np.memmap(
+                path,
+                dtype=spec["dtype"],
+                mode="r",
+                offset=data_start + spec["offset"],
+                shape=shape,
+            )
+
+    return header, arrays
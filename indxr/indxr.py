@@ -4,6 +4,7 @@ from pathlib import Path
 import numpy as np
 import orjson
 
+from . import index_file
 from .handlers import (
     csv_handler,
     custom_handler,
@@ -12,6 +13,8 @@ from .handlers import (
     numpy_handler,
     txt_handler,
 )
+from .offset_index import OffsetIndex
+from .readers import READERS
 
 
 class Indxr:
@@ -20,6 +23,7 @@ class Indxr:
         path: str | Path,
         kind: str = None,
         callback: callable = None,
+        index: OffsetIndex = None,
         **kwargs: dict,
     ):
         """Instantiate Indxr object.
@@ -28,6 +32,7 @@ class Indxr:
             path (str | Path): The path where the file to index is located.
             kind (str, optional): Kind of file to index, must be either "txt", "jsonl", "csv", "tsv", "custom", "dat". If None, it will be automatically inferred from the filename extension.
             callback (Callable, optional): A function to apply to an item when read. Defaults to None.
+            index (OffsetIndex, optional): A pre-built index of the file. If None, the file is indexed. Defaults to None.
 
         Returns:
             Indxr: Indxr object.
@@ -37,8 +42,8 @@ class Indxr:
         self.path = str(path)
         self.kwargs = kwargs
         self.callback = callback
-        self.index = None  # Dict : k -> file position
-        self.index_keys = None  # List of index keys
+        self.index = index  # OffsetIndex : k -> file position
+        self.reader = None  # Lazily opened, fork-safe reader
         self.iteration_index = 0  # Index for iteration
 
         # Infer file extension -------------------------------------------------
@@ -70,16 +75,36 @@ class Indxr:
         if "ids" not in self.kwargs:
             self.kwargs["ids"] = None
 
+        if "num_workers" not in self.kwargs:
+            self.kwargs["num_workers"] = 1
+
+        if "backend" not in self.kwargs:
+            self.kwargs["backend"] = "file"
+
+        if self.kwargs["backend"] not in READERS:
+            raise NotImplementedError(
+                f"Specified `backend` not supported. {self.kwargs['backend']}"
+            )
+
+        self.reader = READERS[self.kwargs["backend"]](self.path)
+
         # Create index ---------------------------------------------------------
-        self.index = self.create_index()
-        self.index_keys = list(self.index)
+        if self.index is None:
+            self.index = self.create_index()
 
-    def create_index(self) -> dict:
+    @property
+    def index_keys(self) -> list[str] | list[int]:
+        """Keys of the indexed items, in file order."""
+        return self.index.keys()
+
+    def create_index(self) -> OffsetIndex:
         if self.kind == "txt":
-            return txt_handler.index(self.path)
+            return txt_handler.index(self.path, self.kwargs["num_workers"])
 
         elif self.kind == "jsonl":
-            return jsonl_handler.index(self.path, self.kwargs["key_id"])
+            return jsonl_handler.index(
+                self.path, self.kwargs["key_id"], self.kwargs["num_workers"]
+            )
 
         elif self.kind in {"csv", "tsv"}:
             fieldnames, index = csv_handler.index(
@@ -89,6 +114,7 @@ class Indxr:
                 has_header=self.kwargs["has_header"],
                 return_dict=self.kwargs["return_dict"],
                 key_id=self.kwargs["key_id"],
+                num_workers=self.kwargs["num_workers"],
             )
             self.kwargs["fieldnames"] = fieldnames
             return index
@@ -108,7 +134,7 @@ class Indxr:
                 )
 
         elif self.kind == "custom":
-            return custom_handler.index(self.path)
+            return custom_handler.index(self.path, self.kwargs["num_workers"])
 
         raise NotImplementedError("Specified `kind` not supported.")
 
@@ -121,43 +147,7 @@ class Indxr:
         Returns:
             str | Dict | np.ndarray: Item.
         """
-        with open(self.path, "rb") as file:
-            if self.kind == "txt":
-                x = txt_handler.get(file=file, index=self.index, idx=key)
-
-            elif self.kind == "jsonl":
-                x = jsonl_handler.get(file=file, index=self.index, idx=key)
-
-            elif self.kind in {"csv", "tsv"}:
-                x = csv_handler.get(
-                    file=file,
-                    index=self.index,
-                    idx=key,
-                    delimiter=self.kwargs["delimiter"],
-                    fieldnames=self.kwargs["fieldnames"],
-                    return_dict=self.kwargs["return_dict"],
-                )
-
-            elif self.kind == "dat":
-                if "mapping" in self.kwargs:
-                    x = multi_vector_handler.get(
-                        path=self.path,
-                        index=self.index,
-                        mapping=self.kwargs["mapping"],
-                        idx=str(key),
-                    )
-                else:
-                    x = numpy_handler.get(
-                        path=self.path, index=self.index, idx=str(key)
-                    )
-
-            elif self.kind == "custom":
-                x = custom_handler.get(file=file, index=self.index, idx=key)
-
-            else:
-                raise NotImplementedError()
-
-        return self.callback(x) if self.callback else x
+        return self._get_row(self.index.row(key))
 
     def mget(self, keys: list[int] | list[str]) -> list[str | dict | np.ndarray]:
         """Get multiple item by key.
@@ -168,50 +158,124 @@ class Indxr:
         Returns:
             List[str | Dict | np.ndarray]: items.
         """
-        with open(self.path, "rb") as file:
-            if self.kind == "txt":
-                xs = txt_handler.mget(file=file, index=self.index, indices=keys)
-
-            elif self.kind == "jsonl":
-                xs = jsonl_handler.mget(file=file, index=self.index, indices=keys)
-
-            elif self.kind in {"csv", "tsv"}:
-                xs = csv_handler.mget(
-                    file=file,
-                    index=self.index,
-                    indices=keys,
-                    delimiter=self.kwargs["delimiter"],
-                    fieldnames=self.kwargs["fieldnames"],
-                    return_dict=self.kwargs["return_dict"],
+        return self._mget_rows(self.index.rows(keys))
+
+    def _get_row(self, row: int) -> str | dict | np.ndarray:
+        position, size = int(self.index.offsets[row]), self.index.size(row)
+
+        if self.kind == "dat":
+            if "mapping" in self.kwargs:
+                x = multi_vector_handler.get(
+                    path=self.path,
+                    position=position,
+                    size=size,
+                    dtype=self.kwargs["dtype"],
+                    dim=self.kwargs["shape"][1],
+                )
+            else:
+                x = numpy_handler.get(
+                    path=self.path,
+                    position=position,
+                    dtype=self.kwargs["dtype"],
+                    dim=self.kwargs["shape"][1],
                 )
 
-            elif self.kind == "dat":
-                if "mapping" in self.kwargs:
-                    xs = multi_vector_handler.mget(
-                        path=file,
-                        index=self.index,
-                        mapping=self.kwargs["mapping"],
-                        indices=[str(idx) for idx in keys],
-                    )
-                else:
-                    xs = numpy_handler.mget(
-                        path=file,
-                        index=self.index,
-                        indices=[str(idx) for idx in keys],
-                    )
-
-            elif self.kind == "custom":
-                xs = custom_handler.mget(file=file, index=self.index, indices=keys)
+            return self.callback(x) if self.callback else x
+
+        if self.kind == "txt":
+            x = txt_handler.get(reader=self.reader, position=position, size=size)
+
+        elif self.kind == "jsonl":
+            x = jsonl_handler.get(reader=self.reader, position=position, size=size)
+
+        elif self.kind in {"csv", "tsv"}:
+            x = csv_handler.get(
+                reader=self.reader,
+                position=position,
+                size=size,
+                delimiter=self.kwargs["delimiter"],
+                fieldnames=self.kwargs["fieldnames"],
+                return_dict=self.kwargs["return_dict"],
+            )
+
+        elif self.kind == "custom":
+            x = custom_handler.get(reader=self.reader, position=position, size=size)
+
+        else:
+            raise NotImplementedError()
+
+        return self.callback(x) if self.callback else x
 
+    def _mget_rows(self, rows: np.ndarray) -> list[str | dict | np.ndarray]:
+        positions, sizes = self.index.offsets[rows], self.index.sizes_of(rows)
+
+        if self.kind == "dat":
+            if "mapping" in self.kwargs:
+                xs = multi_vector_handler.mget(
+                    path=self.path,
+                    positions=positions,
+                    sizes=sizes,
+                    dtype=self.kwargs["dtype"],
+                    dim=self.kwargs["shape"][1],
+                )
             else:
-                raise NotImplementedError()
+                xs = numpy_handler.mget(
+                    path=self.path,
+                    positions=positions,
+                    dtype=self.kwargs["dtype"],
+                    dim=self.kwargs["shape"][1],
+                )
+
+            return [self.callback(x) for x in xs] if self.callback else xs
+
+        if self.kind == "txt":
+            xs = txt_handler.mget(reader=self.reader, positions=positions, sizes=sizes)
+
+        elif self.kind == "jsonl":
+            xs = jsonl_handler.mget(
+                reader=self.reader, positions=positions, sizes=sizes
+            )
+
+        elif self.kind in {"csv", "tsv"}:
+            xs = csv_handler.mget(
+                reader=self.reader,
+                positions=positions,
+                sizes=sizes,
+                delimiter=self.kwargs["delimiter"],
+                fieldnames=self.kwargs["fieldnames"],
+                return_dict=self.kwargs["return_dict"],
+            )
+
+        elif self.kind == "custom":
+            xs = custom_handler.mget(
+                reader=self.reader, positions=positions, sizes=sizes
+            )
+
+        else:
+            raise NotImplementedError()
 
         return [self.callback(x) for x in xs] if self.callback else xs
 
+    def sizeof(self, key: str | int) -> int:
+        """Get the size in bytes of an item by key, as stored on disk.
+
+        Args:
+            key (str | int): Key of the item.
+
+        Returns:
+            int: Size of the item in bytes.
+        """
+        return self.index.size(self.index.row(key))
+
     def get_slice(self, start: int, stop: int) -> np.ndarray:
         if self.kind == "dat":
             return numpy_handler.get_slice(
-                path=self.path, index=self.index, start=start, stop=stop
+                path=self.path,
+                index=self.index,
+                start=start,
+                stop=stop,
+                dtype=self.kwargs["dtype"],
+                dim=self.kwargs["shape"][1],
             )
 
         else:
@@ -220,7 +284,11 @@ class Indxr:
     def mget_slice(self, slices: list[tuple[int]]) -> list[np.ndarray]:
         if self.kind == "dat":
             return numpy_handler.mget_slice(
-                path=self.path, index=self.index, slices=slices
+                path=self.path,
+                index=self.index,
+                slices=slices,
+                dtype=self.kwargs["dtype"],
+                dim=self.kwargs["shape"][1],
             )
 
         else:
@@ -229,27 +297,27 @@ class Indxr:
     def write(self, path: str | Path):
         """Write index to file.
 
+        The index is stored in a binary format that can be memory-mapped by
+        `Indxr.read` in constant time.
+
         Args:
             path (str | Path): Where to write the index.
         """
-        with open(str(path), "wb") as f:
-            f.write(
-                orjson.dumps(
-                    {
-                        "path": self.path,
-                        "kind": self.kind,
-                        "kwargs": self.kwargs,
-                        "index": self.index,
-                        "index_keys": self.index_keys,
-                    },
-                    option=orjson.OPT_INDENT_2,
-                )
-            )
+        index_file.write(
+            str(path),
+            header={"path": self.path, "kind": self.kind, "kwargs": self.kwargs},
+            arrays=self.index.arrays(),
+        )
 
     @staticmethod
     def read(path: str | Path, callback: callable = None):
         """Read index form file.
 
+        The index arrays are memory-mapped, not loaded into memory, so that
+        multiple processes reading the same index file share its pages.
+        Index files written in the legacy JSON format are re-created from the
+        indexed file.
+
         Args:
             path (str | Path): Where to write the index.
             callback (Callable, optional): A function to apply to an item when read. Defaults to None.
@@ -257,18 +325,24 @@ class Indxr:
         Returns:
             Indxr: Indxr object.
         """
-        with open(str(path), "rb") as f:
-            x = orjson.loads(f.read())
+        if index_file.is_index_file(str(path)):
+            x, arrays = index_file.read(str(path))
+            index = OffsetIndex.from_arrays(arrays)
+        else:
+            with open(str(path), "rb") as f:
+                x = orjson.loads(f.read())
+            index = None
 
         if "shape" in x["kwargs"]:
             x["kwargs"]["shape"] = tuple(x["kwargs"]["shape"])
 
-        indxr = Indxr(path=x["path"], kind=x["kind"], **x["kwargs"])
-        indxr.index = x["index"]
-        indxr.index_keys = x["index_keys"]
-        indxr.callback = callback
-
-        return indxr
+        return Indxr(
+            path=x["path"],
+            kind=x["kind"],
+            callback=callback,
+            index=index,
+            **x["kwargs"],
+        )
 
     def generate_batches(self, batch_size: int, shuffle: bool = False):
         """Batch generator.
@@ -286,23 +360,28 @@ class Indxr:
             np.random.shuffle(indices)
 
         for i in range(0, len(self), batch_size):
-            keys = [self.index_keys[key] for key in indices[i : i + batch_size]]
-            yield self.mget(keys)
+            yield self._mget_rows(indices[i : i + batch_size])
+
+    def close(self):
+        """Close the underlying file, which is re-opened if needed."""
+        self.reader.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
 
     def __getitem__(self, key: int | slice) -> str | dict | np.ndarray:
         # Handle single-item access
         if not isinstance(key, slice):
-            return self.get(self.index_keys[key])
+            return self._get_row(range(len(self))[key])
 
         # Handle slicing
-        start = key.start if key.start is not None else 0
-        stop = key.stop if key.stop is not None else len(self)
-        step = key.step if key.step is not None else 1
-        keys = [self.index_keys[i] for i in range(start, stop, step)]
-        return self.mget(keys)
+        return self._mget_rows(np.arange(len(self))[key])
 
     def __len__(self) -> int:
-        return len(self.index_keys)
+        return len(self.index)
 
     def __iter__(self):
         return self
@@ -310,6 +389,6 @@ class Indxr:
     def __next__(self):
         if self.iteration_index >= len(self):
             raise StopIteration
-        result = self.get(self.index_keys[self.iteration_index])
+        result = self._get_row(self.iteration_index)
         self.iteration_index += 1
         return result
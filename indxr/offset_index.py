@@ -0,0 +1,239 @@
+import mmap
+from collections.abc import Iterable
+
+import numpy as np
+
+ARRAYS = ("offsets", "sizes", "sorted_keys", "sorted_rows")
+
+
+def to_key_array(keys: Iterable) -> np.ndarray:
+    """Convert keys to a compact NumPy array.
+
+    Integer keys are stored as `int64`, any other key is stored as UTF-8
+    encoded fixed-width bytes.
+    """
+    keys = list(keys)
+
+    if keys and all(
+        isinstance(k, (int, np.integer)) and not isinstance(k, bool) for k in keys
+    ):
+        return np.asarray(keys, dtype=np.int64)
+
+    return np.asarray([str(k).encode("utf-8") for k in keys], dtype=np.bytes_)
+
+
+class OffsetIndex:
+    def __init__(
+        self,
+        offsets: np.ndarray,
+        keys: Iterable = None,
+        sizes: np.ndarray = None,
+        end: int = None,
+    ):
+        """Compact index of item positions in a file.
+
+        Items are stored in file order as a NumPy `uint64` array of byte offsets
+        and are addressed positionally (i.e., "0", "1", ...). If `keys` are
+        provided, they are kept in a sorted table together with the row each of
+        them points to, so that lookups are performed by binary search without
+        any per-item Python object.
+
+        Items are either contiguous, and their sizes are derived from
+        consecutive offsets and the `end` of the last item, or have explicit
+        `sizes`.
+
+        Args:
+            offsets (np.ndarray): Byte offset of each item.
+            keys (Iterable, optional): Key of each item. Defaults to None.
+            sizes (np.ndarray, optional): Byte size of each item. Defaults to None.
+            end (int, optional): Byte offset where the last item ends. Defaults to None.
+        """
+        assert (sizes is None) != (end is None), "Please provide either sizes or end."
+
+        self.offsets = np.asarray(offsets, dtype=np.uint64)
+        self.sizes = None if sizes is None else np.asarray(sizes, dtype=np.uint64)
+        self.end = None if end is None else int(end)
+        self.sorted_keys = None  # Sorted key table
+        self.sorted_rows = None  # Row pointed by each key in `sorted_keys`
+
+        if keys is not None:
+            keys = to_key_array(keys)
+            assert len(keys) == len(self.offsets), "Please provide a key for each item."
+            self.sorted_rows = np.argsort(keys, kind="stable").astype(np.uint64)
+            self.sorted_keys = keys[self.sorted_rows]
+
+    def arrays(self) -> dict[str, np.ndarray]:
+        """Arrays backing the index, as stored in index files."""
+        arrays = {name: getattr(self, name) for name in ARRAYS}
+        arrays["end"] = None if self.end is None else np.asarray([self.end])
+        return arrays
+
+    @classmethod
+    def from_arrays(cls, arrays: dict[str, np.ndarray]):
+        """Rebuild an index from its arrays, without copying nor sorting them."""
+        index = cls.__new__(cls)
+        for name in ARRAYS:
+            setattr(index, name, arrays.get(name))
+        index.end = None if arrays.get("end") is None else int(arrays["end"][0])
+        return index
+
+    def __getstate__(self) -> dict:
+        # Memory-mapped arrays are pickled by reference, so that processes
+        # receiving the index (e.g., DataLoader workers) map the same pages
+        # instead of materializing their own copy
+        state = {}
+        for name, array in self.arrays().items():
+            if isinstance(array, np.memmap) and isinstance(array.base, mmap.mmap):
+                state[name] = (
+                    "memmap",
+                    array.filename,
+                    array.offset,
+                    array.dtype.str,
+                    array.shape,
+                )
+            else:
+                state[name] = array
+        state["end"] = self.end
+        return state
+
+    def __setstate__(self, state: dict):
+        for name in ARRAYS:
+            array = state.get(name)
+            if isinstance(array, tuple):
+                _, filename, offset, dtype, shape = array
+                array = np.memmap(
+                    filename, dtype=dtype, mode="r", offset=offset, shape=shape
+                )
+            setattr(self, name, array)
+        self.end = state["end"]
+
+    @property
+    def has_keys(self) -> bool:
+        return self.sorted_keys is not None
+
+    def normalize_key(self, key: str | int) -> bytes | int:
+        if self.sorted_keys.dtype.kind == "S":
+            return key if isinstance(key, bytes) else str(key).encode("utf-8")
+        return int(key)
+
+    def row(self, key: str | int) -> int:
+        """Get the row of an item by key."""
+        if not self.has_keys:
+            try:
+                row = int(key)
+            except (TypeError, ValueError):
+                raise KeyError(key) from None
+
+            if not 0 <= row < len(self):
+                raise KeyError(key)
+
+            return row
+
+        try:
+            k = self.normalize_key(key)
+        except (TypeError, ValueError):
+            raise KeyError(key) from None
+
+        # Duplicated keys point to their last occurrence, as in a Python dict
+        i = int(np.searchsorted(self.sorted_keys, k, side="right")) - 1
+
+        if i < 0 or self.sorted_keys[i] != k:
+            raise KeyError(key)
+
+        return int(self.sorted_rows[i])
+
+    def rows(self, keys: list[str] | list[int]) -> np.ndarray:
+        """Get the rows of multiple items by key."""
+        if len(keys) == 0:
+            return np.empty(0, dtype=np.int64)
+
+        if not self.has_keys:
+            try:
+                rows = np.asarray(keys).astype(np.int64)
+            except (TypeError, ValueError):
+                return np.asarray([self.row(k) for k in keys], dtype=np.int64)
+
+            if rows.ndim != 1 or ((rows < 0) | (rows >= len(self))).any():
+                return np.asarray([self.row(k) for k in keys], dtype=np.int64)
+
+            return rows
+
+        try:
+            ks = np.asarray([self.normalize_key(k) for k in keys])
+        except (TypeError, ValueError):
+            return np.asarray([self.row(k) for k in keys], dtype=np.int64)
+
+        i = np.searchsorted(self.sorted_keys, ks, side="right") - 1
+        found = (i >= 0) & (self.sorted_keys[np.maximum(i, 0)] == ks)
+
+        if not found.all():
+            raise KeyError(keys[int(np.argmin(found))])
+
+        return self.sorted_rows[i].astype(np.int64)
+
+    def size(self, row: int) -> int:
+        """Byte size of an item by row."""
+        return int(self.sizes_of(np.asarray([row]))[0])
+
+    def sizes_of(self, rows: np.ndarray) -> np.ndarray:
+        """Byte sizes of multiple items by row."""
+        rows = np.asarray(rows, dtype=np.int64)
+        rows = np.where(rows < 0, rows + len(self), rows)
+
+        if self.sizes is not None:
+            return self.sizes[rows]
+
+        # An item ends where the next one starts, the last one ends at `end`
+        following = rows + 1
+        ends = np.where(
+            following < len(self),
+            self.offsets[np.minimum(following, len(self) - 1)],
+            np.uint64(self.end),
+        )
+
+        return ends - self.offsets[rows]
+
+    def keys(self) -> list[str] | list[int]:
+        """Keys of the indexed items in file order."""
+        if not self.has_keys:
+            return [str(i) for i in range(len(self))]
+
+        keys = np.empty_like(self.sorted_keys)
+        keys[self.sorted_rows] = self.sorted_keys
+
+        if keys.dtype.kind == "S":
+            return [k.decode("utf-8") for k in keys.tolist()]
+        return keys.tolist()
+
+    def __getitem__(self, key: str | int) -> int:
+        return int(self.offsets[self.row(key)])
+
+    def __contains__(self, key: str | int) -> bool:
+        try:
+            self.row(key)
+        except KeyError:
+            return False
+        return True
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, OffsetIndex):
+            return NotImplemented
+
+        def same(x, y):
+            if x is None or y is None:
+                return x is None and y is None
+            return x.dtype.kind == y.dtype.kind and np.array_equal(x, y)
+
+        return (
+            same(self.offsets, other.offsets)
+            and same(self.sizes, other.sizes)
+            and self.end == other.end
+            and same(self.sorted_keys, other.sorted_keys)
+            and same(self.sorted_rows, other.sorted_rows)
+        )
@@ -0,0 +1,171 @@
+import mmap
+import os
+import threading
+
+import numpy as np
+
+
+class FileReader:
+    def __init__(self, path: str):
+        """Positional reader over a file.
+
+        The file descriptor is opened lazily, re-opened after fork (e.g., in
+        PyTorch DataLoader workers), and never shared across processes. Reads
+        are performed with `os.pread`, hence they do not depend on the position
+        of the file descriptor and are thread-safe.
+
+        Args:
+            path (str): Path of the file to read.
+        """
+        self.path = path
+        self.fd = None
+        self.pid = None
+        self.lock = threading.Lock()
+
+    def fileno(self) -> int:
+        if self.fd is None or self.pid != os.getpid():
+            with self.lock:
+                if self.fd is None or self.pid != os.getpid():
+                    if self.fd is not None:
+                        os.close(self.fd)  # Copy inherited from the parent process
+                    self.fd = os.open(
+                        self.path, os.O_RDONLY | getattr(os, "O_BINARY", 0)
+                    )
+                    self.pid = os.getpid()
+
+        return self.fd
+
+    def read(self, position: int, size: int) -> bytes:
+        """Read `size` bytes starting at `position`."""
+        return pread(self.fileno(), size, position, self.lock)
+
+    def close(self):
+        with self.lock:
+            if self.fd is not None and self.pid == os.getpid():
+                os.close(self.fd)
+            self.fd, self.pid = None, None
+
+    def __getstate__(self) -> dict:
+        # File descriptors and locks are process-specific
+        return {"path": self.path}
+
+    def __setstate__(self, state: dict):
+        self.__init__(state["path"])
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
+class MmapReader:
+    def __init__(self, path: str):
+        """Reader over a memory-mapped file.
+
+        The file is mapped once, lazily, and records are returned as memory
+        views of the mapping, i.e., without copies. The mapping is read-only,
+        hence it can be safely shared with forked processes and threads.
+
+        Args:
+            path (str): Path of the file to read.
+        """
+        self.path = path
+        self.mm = None
+        self.view = None
+        self.lock = threading.Lock()
+
+    def mapping(self) -> memoryview:
+        if self.view is None:
+            with self.lock:
+                if self.view is None:
+                    with open(self.path, "rb") as file:
+                        if os.fstat(file.fileno()).st_size == 0:
+                            self.view = memoryview(b"")  # Empty files cannot be mapped
+                        else:
+                            self.mm = mmap.mmap(
+                                file.fileno(), 0, access=mmap.ACCESS_READ
+                            )
+                            self.view = memoryview(self.mm)
+
+        return self.view
+
+    def read(self, position: int, size: int) -> memoryview:
+        """Read `size` bytes starting at `position`."""
+        return self.mapping()[position : position + size]
+
+    def close(self):
+        with self.lock:
+            if self.view is not None:
+                self.view.release()
+            if self.mm is not None:
+                try:
+                    self.mm.close()
+                except BufferError:
+                    pass  # Returned records still in use, unmapped when released
+            self.mm, self.view = None, None
+
+    def __getstate__(self) -> dict:
+        # Mappings and locks are process-specific
+        return {"path": self.path}
+
+    def __setstate__(self, state: dict):
+        self.__init__(state["path"])
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
+Reader = FileReader | MmapReader
+READERS = {"file": FileReader, "mmap": MmapReader}
+
+
+def read_many(
+    reader: Reader, positions: np.ndarray, sizes: np.ndarray
+) -> list[bytes | memoryview]:
+    """Read multiple records, coalescing contiguous ones into single reads.
+
+    Args:
+        reader (Reader): Reader of the file.
+        positions (np.ndarray): Byte offsets of the records.
+        sizes (np.ndarray): Byte sizes of the records.
+
+    Returns:
+        list[bytes | memoryview]: Records, in the same order as `positions`.
+    """
+    if len(positions) == 0:
+        return []
+
+    order = np.argsort(positions, kind="stable")
+    starts = positions[order].astype(np.int64)
+    ends = starts + sizes[order].astype(np.int64)
+
+    # A run of records ends where the next record does not start right after it
+    run_ends = np.maximum.accumulate(ends)
+    breaks = np.flatnonzero(starts[1:] > run_ends[:-1]) + 1
+    bounds = [0, *breaks.tolist(), len(starts)]
+
+    order, starts, ends = order.tolist(), starts.tolist(), ends.tolist()
+    records = [None] * len(order)
+
+    for a, b in zip(bounds[:-1], bounds[1:]):
+        offset = starts[a]
+        data = reader.read(offset, int(run_ends[b - 1]) - offset)
+
+        for i in range(a, b):
+            records[order[i]] = data[starts[i] - offset : ends[i] - offset]
+
+    return records
+
+
+def pread(fd: int, size: int, position: int, lock: threading.Lock) -> bytes:
+    if hasattr(os, "pread"):
+        return os.pread(fd, size, position)
+
+    # Fallback for platforms without pread (i.e., Windows)
+    with lock:
+        os.lseek(fd, position, os.SEEK_SET)
+        return os.read(fd, size)
@@ -0,0 +1,149 @@
+import os
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+# Larger chunks are slower to scan as they do not fit in CPU caches
+CHUNK_SIZE = 1 << 20  # 1 MiB
+NEWLINE = ord("\n")
+
+
+def iter_chunks(
+    path: str, start: int = 0, stop: int = None, chunk_size: int = CHUNK_SIZE
+) -> Iterator[tuple[int, bytes, np.ndarray]]:
+    """Read a file in large chunks of whole lines.
+
+    Newlines are located with NumPy vectorized search, so that the cost of
+    scanning a file is bounded by disk bandwidth rather than by the Python
+    interpreter. Chunks are never copied: a chunk may end with a partial line,
+    which is excluded from its bounds and read again as part of the next chunk.
+    `start` must be the beginning of a line.
+
+    Args:
+        path (str): Path of the file to scan.
+        start (int, optional): Byte offset where to start scanning. Defaults to 0.
+        stop (int, optional): Byte offset where to stop scanning. If None, the file is scanned until the end. Defaults to None.
+        chunk_size (int, optional): Number of bytes read at a time. Defaults to 1 MiB.
+
+    Yields:
+        tuple[int, bytes, np.ndarray]: Byte offset of the chunk, chunk, and bounds of its lines, i.e., the i-th line is `chunk[bounds[i] : bounds[i + 1]]`.
+    """
+    end = os.path.getsize(path) if stop is None else min(stop, os.path.getsize(path))
+
+    with open(path, "rb", buffering=0) as file:
+        position, size = start, chunk_size
+
+        while position < end:
+            file.seek(position)
+            data = file.read(min(size, end - position))
+            if not data:
+                break
+
+            newlines = np.flatnonzero(np.frombuffer(data, dtype=np.uint8) == NEWLINE)
+
+            if position + len(data) >= end:
+                cut = len(data)  # Last chunk, the last line may lack a newline
+            elif len(newlines) == 0:
+                size *= 2  # Line longer than chunk, read it again with a larger one
+                continue
+            else:
+                cut = int(newlines[-1]) + 1
+
+            bounds = np.concatenate(([0], newlines[newlines < cut - 1] + 1, [cut]))
+
+            yield position, data, bounds
+
+            position, size = position + cut, chunk_size
+
+
+def line_offsets(
+    path: str, start: int = 0, stop: int = None, chunk_size: int = CHUNK_SIZE
+) -> np.ndarray:
+    """Byte offsets of the lines of a file.
+
+    Args:
+        path (str): Path of the file to scan.
+        start (int, optional): Byte offset where to start scanning. Defaults to 0.
+        stop (int, optional): Byte offset where to stop scanning. If None, the file is scanned until the end. Defaults to None.
+        chunk_size (int, optional): Number of bytes read at a time. Defaults to 1 MiB.
+
+    Returns:
+        np.ndarray: Byte offsets of the lines.
+    """
+    offsets = [
+        bounds[:-1].astype(np.uint64) + np.uint64(position)
+        for position, _, bounds in iter_chunks(path, start, stop, chunk_size)
+    ]
+
+    return np.concatenate(offsets) if offsets else np.empty(0, dtype=np.uint64)
+
+
+def iter_lines(chunk: bytes, bounds: np.ndarray) -> Iterator[memoryview]:
+    """Iterate over the lines of a chunk yielded by `iter_chunks`, without copies."""
+    view = memoryview(chunk)
+    bounds = bounds.tolist()
+
+    for a, b in zip(bounds[:-1], bounds[1:]):
+        yield view[a:b]
+
+
+def split(path: str, n: int, start: int = 0, stop: int = None) -> list[tuple[int, int]]:
+    """Split a file into at most `n` byte ranges aligned to line boundaries.
+
+    Args:
+        path (str): Path of the file to split.
+        n (int): Number of ranges.
+        start (int, optional): Byte offset where the first range starts. Defaults to 0.
+        stop (int, optional): Byte offset where the last range stops. If None, it is the end of the file. Defaults to None.
+
+    Returns:
+        list[tuple[int, int]]: Start and stop byte offsets of each range.
+    """
+    size = os.path.getsize(path) if stop is None else stop
+    bounds = [start]
+
+    with open(path, "rb") as file:
+        for i in range(1, n):
+            guess = start + (size - start) * i // n
+            if guess <= bounds[-1]:
+                continue
+
+            # Move to the beginning of the first line starting at or after guess
+            file.seek(guess - 1)
+            file.readline()
+            position = file.tell()
+
+            if bounds[-1] < position < size:
+                bounds.append(position)
+
+    bounds.append(max(size, start))
+
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def map_ranges(
+    fn: Callable, path: str, num_workers: int = 1, start: int = 0, stop: int = None
+) -> list:
+    """Apply `fn(start, stop)` to line-aligned byte ranges of a file.
+
+    If `num_workers` is greater than one, ranges are processed in parallel by
+    separate processes, therefore `fn` must be picklable.
+
+    Args:
+        fn (Callable): Function to apply to each range.
+        path (str): Path of the file to process.
+        num_workers (int, optional): Number of processes. Defaults to 1.
+        start (int, optional): Byte offset where to start processing. Defaults to 0.
+        stop (int, optional): Byte offset where to stop processing. If None, the file is processed until the end. Defaults to None.
+
+    Returns:
+        list: Results of `fn` for each range, in file order.
+    """
+    ranges = split(path, num_workers, start, stop)
+
+    if num_workers <= 1 or len(ranges) <= 1:
+        return [fn(a, b) for a, b in ranges]
+
+    with ProcessPoolExecutor(min(num_workers, len(ranges))) as executor:
+        return list(executor.map(fn, *zip(*ranges)))
@@ -79,3 +79,11 @@ def test_write_read():
     assert index_2.index_keys == index_1.index_keys
 
     os.remove("tests/test_index.json")
+
+
+def test_csv_num_workers():
+    index_1 = Indxr("tests/test_data/sample_w_header.csv")
+    index_2 = Indxr("tests/test_data/sample_w_header.csv", num_workers=2)
+
+    assert index_2.index == index_1.index
+    assert index_2.mget(["2", "0"]) == index_1.mget(["2", "0"])
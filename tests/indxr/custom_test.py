@@ -60,6 +60,14 @@ def test_custom_callback():
     ]
 
 
+def test_custom_mmap_backend():
+    index = Indxr("tests/test_data/sample.txt", kind="custom", backend="mmap")
+
+    assert isinstance(index[0], memoryview)
+    assert index[0] == b"this is line 0"
+    assert index.mget(["2", "0"]) == [b"this is line 2", b"this is line 0"]
+
+
 def test_write_read():
     index_1 = Indxr("tests/test_data/sample.txt", kind="custom")
     index_1.write("tests/test_index.json")
@@ -0,0 +1,75 @@
+import os
+import pickle
+
+import numpy as np
+import orjson
+import pytest
+
+from indxr import Indxr
+from indxr import index_file
+
+
+# FIXTURES =====================================================================
+@pytest.fixture
+def path():
+    yield "tests/test_index.idx"
+    os.remove("tests/test_index.idx")
+
+
+# TESTS ========================================================================
+def test_write_read_arrays(path):
+    arrays = {
+        "a": np.arange(10, dtype=np.uint64),
+        "b": np.asarray([b"x", b"yy", b"zzz"]),
+        "c": None,
+        "d": np.empty(0, dtype=np.int64),
+    }
+    index_file.write(path, header={"foo": "bar"}, arrays=arrays)
+
+    assert index_file.is_index_file(path)
+
+    header, out = index_file.read(path)
+
+    assert header == {"foo": "bar"}
+    assert set(out) == {"a", "b", "d"}
+    assert isinstance(out["a"], np.memmap)
+    assert np.array_equal(out["a"], arrays["a"])
+    assert np.array_equal(out["b"], arrays["b"])
+    assert out["d"].shape == (0,)
+
+
+def test_read_is_memory_mapped(path):
+    index_1 = Indxr("tests/test_data/sample.jsonl")
+    index_1.write(path)
+    index_2 = Indxr.read(path)
+
+    assert isinstance(index_2.index.offsets, np.memmap)
+    assert isinstance(index_2.index.sorted_keys, np.memmap)
+    assert index_2.get("id_1") == index_1.get("id_1")
+    assert index_2.mget(["id_2", "id_0"]) == index_1.mget(["id_2", "id_0"])
+
+    # Memory-mapped arrays are pickled by reference
+    index_3 = pickle.loads(pickle.dumps(index_2))
+
+    assert isinstance(index_3.index.offsets, np.memmap)
+    assert index_3.index == index_1.index
+    assert index_3.get("id_1") == index_1.get("id_1")
+
+
+def test_read_legacy_json(path):
+    with open(path, "wb") as f:
+        f.write(
+            orjson.dumps(
+                {
+                    "path": "tests/test_data/sample.txt",
+                    "kind": "txt",
+                    "kwargs": {},
+                    "index": {"0": 0, "1": 15, "2": 30},
+                    "index_keys": ["0", "1", "2"],
+                }
+            )
+        )
+
+    index = Indxr.read(path)
+
+    assert index.get("1") == "this is line 1"
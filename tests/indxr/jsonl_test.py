@@ -1,8 +1,11 @@
+import json
 import os
 
+import orjson
 import pytest
 
 from indxr import Indxr
+from indxr.handlers import jsonl_handler
 
 # FIXTURES =====================================================================
 
@@ -64,3 +67,39 @@ def test_write_read():
     assert index_2.index_keys == index_1.index_keys
 
     os.remove("tests/test_index.json")
+
+
+def test_jsonl_num_workers():
+    index_1 = Indxr("tests/test_data/sample.jsonl")
+    index_2 = Indxr("tests/test_data/sample.jsonl", num_workers=2)
+
+    assert index_2.index == index_1.index
+    assert index_2.mget(["id_2", "id_0"]) == index_1.mget(["id_2", "id_0"])
+
+
+@pytest.mark.parametrize(
+    "record",
+    [
+        {"id": "doc_1", "text": "x" * 4096},
+        {"id": 42, "text": "x" * 4096},
+        {"id": -42, "text": "x" * 4096},
+        {"id": 1.5, "text": "x" * 4096},
+        {"id": None, "text": "x" * 4096},
+        {"id": 'quoted "id"', "text": "x" * 4096},
+        {"id": "àèìòù", "text": "x" * 4096},
+        {"text": "x" * 4096, "id": "doc_1"},
+        {"meta": {"id": "nested"}, "id": "doc_1", "text": "x" * 4096},
+        {"id": {"nested": 1}, "text": "x" * 4096},
+        {"id": "doc_1"},
+    ],
+)
+def test_jsonl_extract_key(record):
+    compact = orjson.dumps(record) + b"\n"
+    spaced = json.dumps(record, ensure_ascii=False).encode("utf-8") + b"\n"
+
+    for line in [compact, spaced]:
+        assert jsonl_handler.extract_key(line, "id") == record["id"]
+
+        # Line in a larger buffer
+        buffer = b"garbage" + line + b"garbage"
+        assert jsonl_handler.extract_key(buffer, "id", 7, 7 + len(line)) == record["id"]
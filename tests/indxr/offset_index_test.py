@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+
+from indxr.offset_index import OffsetIndex
+
+# FIXTURES =====================================================================
+
+# TESTS ========================================================================
+def test_positional_index():
+    index = OffsetIndex([0, 15, 30], end=44)
+
+    assert len(index) == 3
+    assert index.offsets.dtype == np.uint64
+    assert index["0"] == 0
+    assert index[2] == 30
+    assert index.row("1") == 1
+    assert index.rows(["2", "0"]).tolist() == [2, 0]
+    assert index.keys() == ["0", "1", "2"]
+    assert "3" not in index
+
+    with pytest.raises(KeyError):
+        index.row("3")
+
+    with pytest.raises(KeyError):
+        index.rows(["0", "-1"])
+
+
+def test_keyed_index():
+    index = OffsetIndex([0, 15, 30], end=44, keys=["id_2", "id_0", "id_1"])
+
+    assert index.sorted_keys.dtype.kind == "S"
+    assert index["id_2"] == 0
+    assert index["id_1"] == 30
+    assert index.rows(["id_0", "id_1", "id_2"]).tolist() == [1, 2, 0]
+    assert index.keys() == ["id_2", "id_0", "id_1"]
+
+    with pytest.raises(KeyError):
+        index.row("id_3")
+
+    with pytest.raises(KeyError):
+        index.rows(["id_0", "id_3"])
+
+
+def test_int_keyed_index():
+    index = OffsetIndex([0, 15, 30], end=44, keys=[10, 5, 7])
+
+    assert index.sorted_keys.dtype == np.int64
+    assert index[5] == 15
+    assert index.rows([7, 10]).tolist() == [2, 0]
+    assert index.keys() == [10, 5, 7]
+
+
+def test_duplicated_keys():
+    index = OffsetIndex([0, 15, 30], end=44, keys=["a", "b", "a"])
+
+    assert index["a"] == 30
+
+
+def test_eq():
+    assert OffsetIndex([0, 15], keys=["a", "b"], end=30) == OffsetIndex(
+        [0, 15], keys=["a", "b"], end=30
+    )
+    assert OffsetIndex([0, 15], end=30) != OffsetIndex([0, 15], end=31)
+    assert OffsetIndex([0, 15], end=30) != OffsetIndex(
+        [0, 15], keys=["a", "b"], end=30
+    )
+
+
+def test_sizes():
+    index = OffsetIndex([0, 15, 30], end=44)
+
+    assert index.size(0) == 15
+    assert index.size(2) == 14
+    assert index.sizes_of([2, 0, 1, -1]).tolist() == [14, 15, 15, 14]
+
+    index = OffsetIndex([30, 0], sizes=[10, 20])
+
+    assert index.size(0) == 10
+    assert index.sizes_of([1, 0]).tolist() == [20, 10]
@@ -0,0 +1,138 @@
+import os
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from indxr import Indxr
+from indxr.readers import FileReader, MmapReader, read_many
+
+# FIXTURES =====================================================================
+
+# TESTS ========================================================================
+def test_file_reader():
+    reader = FileReader("tests/test_data/sample.txt")
+
+    assert reader.fd is None  # Lazily opened
+    assert reader.read(0, 15) == b"this is line 0\n"
+    assert reader.read(30, 100) == b"this is line 2"
+    assert reader.read(15, 4) == b"this"
+
+    fd = reader.fileno()
+    reader.read(15, 15)
+
+    assert reader.fileno() == fd  # Not re-opened
+
+    reader.close()
+
+    assert reader.fd is None
+    assert reader.read(15, 15) == b"this is line 1\n"  # Re-opened
+
+
+def test_file_reader_pickle():
+    reader = FileReader("tests/test_data/sample.txt")
+    reader.fileno()
+    reader = pickle.loads(pickle.dumps(reader))
+
+    assert reader.fd is None
+    assert reader.read(15, 15) == b"this is line 1\n"
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="fork not available")
+def test_file_reader_fork():
+    reader = FileReader("tests/test_data/sample.txt")
+    parent_fd = reader.fileno()
+
+    r, w = os.pipe()
+    pid = os.fork()
+
+    if pid == 0:  # Child
+        try:
+            ok = reader.read(15, 15) == b"this is line 1\n"
+            ok = ok and reader.pid == os.getpid()
+            os.write(w, b"1" if ok else b"0")
+        finally:
+            os._exit(0)
+
+    os.waitpid(pid, 0)
+
+    assert os.read(r, 1) == b"1"
+    assert reader.fileno() == parent_fd
+    assert reader.read(0, 15) == b"this is line 0\n"
+
+
+def test_indxr_context_manager():
+    with Indxr("tests/test_data/sample.jsonl") as index:
+        assert index.get("id_1")["id"] == "id_1"
+
+        with ThreadPoolExecutor(4) as executor:
+            out = list(executor.map(index.get, ["id_0", "id_1", "id_2"] * 10))
+
+        assert [x["id"] for x in out] == ["id_0", "id_1", "id_2"] * 10
+
+    assert index.reader.fd is None
+
+
+def test_mmap_reader():
+    reader = MmapReader("tests/test_data/sample.txt")
+
+    assert reader.view is None  # Lazily mapped
+    assert isinstance(reader.read(0, 15), memoryview)
+    assert reader.read(0, 15) == b"this is line 0\n"
+    assert reader.read(30, 100) == b"this is line 2"
+    assert reader.read(15, 4) == b"this"
+
+    line = reader.read(15, 15)
+    reader.close()
+
+    assert bytes(line) == b"this is line 1\n"  # Still valid after close
+    assert reader.read(15, 15) == b"this is line 1\n"  # Re-mapped
+
+
+def test_mmap_reader_empty_file(tmp_path):
+    path = str(tmp_path / "empty.txt")
+    open(path, "wb").close()
+
+    assert MmapReader(path).read(0, 10) == b""
+
+
+@pytest.mark.parametrize("reader_class", [FileReader, MmapReader])
+def test_read_many(reader_class):
+    reader = reader_class("tests/test_data/sample.txt")
+    positions = np.asarray([30, 0, 15, 0, 5], dtype=np.uint64)
+    sizes = np.asarray([14, 15, 15, 4, 2], dtype=np.uint64)
+
+    assert read_many(reader, positions, sizes) == [
+        b"this is line 2",
+        b"this is line 0\n",
+        b"this is line 1\n",
+        b"this",
+        b"is",
+    ]
+    assert read_many(reader, positions[:0], sizes[:0]) == []
+
+
+@pytest.mark.parametrize(
+    "path,kind",
+    [
+        ("tests/test_data/sample.txt", "txt"),
+        ("tests/test_data/sample.txt", "custom"),
+        ("tests/test_data/sample.jsonl", "jsonl"),
+        ("tests/test_data/sample_w_header.csv", "csv"),
+        ("tests/test_data/sample_w_header.tsv", "tsv"),
+    ],
+)
+def test_mmap_backend(path, kind):
+    index_1 = Indxr(path, kind=kind)
+    index_2 = Indxr(path, kind=kind, backend="mmap")
+    keys = index_1.index_keys[::-1]
+
+    assert index_2[:] == index_1[:]
+    assert index_2.mget(keys) == index_1.mget(keys)
+    assert [index_2.get(k) for k in keys] == [index_1.get(k) for k in keys]
+
+
+def test_unknown_backend():
+    with pytest.raises(NotImplementedError):
+        Indxr("tests/test_data/sample.txt", backend="foo")
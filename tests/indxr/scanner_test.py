@@ -0,0 +1,95 @@
+import os
+from functools import partial
+
+import numpy as np
+import pytest
+
+from indxr import scanner
+
+
+# FIXTURES =====================================================================
+@pytest.fixture
+def path():
+    yield "tests/test_scanner.txt"
+    os.remove("tests/test_scanner.txt")
+
+
+def naive_line_offsets(path):
+    offsets = []
+    with open(path, "rb") as file:
+        position = file.tell()
+        for _ in file:
+            offsets.append(position)
+            position = file.tell()
+    return offsets
+
+
+# TESTS ========================================================================
+@pytest.mark.parametrize(
+    "content",
+    [
+        b"",
+        b"\n",
+        b"a",
+        b"a\n",
+        b"a\nbb\nccc",
+        b"a\nbb\nccc\n",
+        b"\n\na\n\nb\n",
+        b"a very long line that does not fit in a single chunk\nb\n",
+    ],
+)
+@pytest.mark.parametrize("chunk_size", [1, 3, 1 << 20])
+def test_line_offsets(path, content, chunk_size):
+    with open(path, "wb") as f:
+        f.write(content)
+
+    offsets = scanner.line_offsets(path, chunk_size=chunk_size)
+
+    assert offsets.dtype == np.uint64
+    assert offsets.tolist() == naive_line_offsets(path)
+
+
+def test_line_offsets_range(path):
+    with open(path, "wb") as f:
+        f.write(b"a\nbb\nccc\ndddd\n")
+
+    assert scanner.line_offsets(path, start=2, stop=9, chunk_size=2).tolist() == [2, 5]
+
+
+def test_iter_lines(path):
+    with open(path, "wb") as f:
+        f.write(b"a\nbb\nccc")
+
+    lines = [
+        bytes(line)
+        for _, chunk, bounds in scanner.iter_chunks(path, chunk_size=4)
+        for line in scanner.iter_lines(chunk, bounds)
+    ]
+
+    assert lines == [b"a\n", b"bb\n", b"ccc"]
+
+
+def test_split(path):
+    with open(path, "wb") as f:
+        f.write(b"".join(f"line {i}\n".encode() for i in range(100)))
+
+    for n in [1, 2, 3, 7, 200]:
+        ranges = scanner.split(path, n)
+        offsets = naive_line_offsets(path)
+
+        assert len(ranges) <= n
+        assert ranges[0][0] == 0
+        assert ranges[-1][1] == os.path.getsize(path)
+        assert all(a[1] == b[0] for a, b in zip(ranges, ranges[1:]))
+        assert all(start in offsets for start, _ in ranges)
+
+
+def test_map_ranges(path):
+    with open(path, "wb") as f:
+        f.write(b"".join(f"line {i}\n".encode() for i in range(100)))
+
+    offsets = scanner.map_ranges(
+        partial(scanner.line_offsets, path), path, num_workers=4
+    )
+
+    assert np.concatenate(offsets).tolist() == naive_line_offsets(path)
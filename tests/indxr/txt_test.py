@@ -68,3 +68,11 @@ def test_write_read():
     assert index_2.index_keys == index_1.index_keys
 
     os.remove("tests/test_index.json")
+
+
+def test_txt_num_workers():
+    index_1 = Indxr("tests/test_data/sample.txt")
+    index_2 = Indxr("tests/test_data/sample.txt", num_workers=2)
+
+    assert index_2.index == index_1.index
+    assert index_2[:] == index_1[:]